@@ -0,0 +1,82 @@
+"""Optional build step that compiles `parser` and `exceptions` with Cython.
+
+Cython is listed in `build-system.requires`, so a regular `pip install` builds
+the extensions whenever a working C compiler is found, and otherwise produces a
+pure Python wheel. The `DPYDEVTOOLS_CYTHON` environment variable overrides the
+detection: `True` always builds (and fails without a compiler) and `False`
+skips compilation entirely. Both modules stay pure Python, so the package works
+the same whether or not the extensions are built.
+
+:copyright: (c) 2022-present Tanner B. Corcoran
+:license: MIT, see LICENSE for more details.
+"""
+
+from setuptools.command.build_ext import build_ext
+from distutils.ccompiler import new_compiler
+from distutils import sysconfig
+from setuptools import errors
+from setuptools import setup
+import warnings
+import tempfile
+import os
+
+CYTHON_MODULES = ["src/dpydevtools/parser.py", "src/dpydevtools/exceptions.py"]
+
+_USE_CYTHON = os.environ.get("DPYDEVTOOLS_CYTHON", "").strip().lower()
+_REQUIRED = _USE_CYTHON in ("1", "true", "yes")
+_BUILD_ERRORS = (errors.CCompilerError, errors.CompileError, errors.LinkError,
+                 errors.ExecError, errors.PlatformError, OSError)
+
+
+class _OptionalBuildExt(build_ext):
+    # a missing or failing C toolchain leaves the pure Python modules in place
+    def run(self) -> None:
+        try:
+            super().run()
+        except _BUILD_ERRORS as exc:
+            if _REQUIRED:
+                raise
+            warnings.warn(f"skipping Cython extensions: {exc}")
+
+    def build_extension(self, ext) -> None:
+        try:
+            super().build_extension(ext)
+        except _BUILD_ERRORS as exc:
+            if _REQUIRED:
+                raise
+            warnings.warn(f"skipping Cython extension {ext.name}: {exc}")
+
+
+def _compiler_works() -> bool:
+    # compile a stub against the Python headers; without this a build with no
+    # usable toolchain would still be tagged as a platform wheel
+    compiler = new_compiler()
+    sysconfig.customize_compiler(compiler)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "probe.c")
+        with open(source, "w") as f:
+            f.write("#include <Python.h>\n")
+        try:
+            compiler.compile([source], output_dir=tmp,
+                             include_dirs=[sysconfig.get_python_inc()])
+        except _BUILD_ERRORS:
+            return False
+    return True
+
+
+def _ext_modules() -> list:
+    if _USE_CYTHON in ("0", "false", "no"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        if _REQUIRED:
+            raise
+        return []
+    if not _REQUIRED and not _compiler_works():
+        return []
+    return cythonize(CYTHON_MODULES, language_level=3)
+
+
+setup(ext_modules=_ext_modules(), cmdclass={"build_ext": _OptionalBuildExt},
+      exclude_package_data={"dpydevtools": ["*.c"]})
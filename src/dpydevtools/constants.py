@@ -8,12 +8,18 @@ __author__ = "Tanner B. Corcoran"
 __license__ = "MIT License"
 __copyright__ = "Copyright (c) 2022-present Tanner B. Corcoran"
 
-ALLOWCHARS = set("abcdefghijklmnopqrstuvwxyz1234567890_")
+ALLOWCHARS = frozenset("abcdefghijklmnopqrstuvwxyz1234567890_")
+ALLOWCHARS__DELETE = str.maketrans("", "", "".join(ALLOWCHARS))
 
 EMBED_COLOR__DEF = 0xeb9b2a
 EMBED_COLOR__POS = 0x43b582
 EMBED_COLOR__NEG = 0xeb4747
 
+FANOUT_CONCURRENCY = 5
+SYNC_MAX_RETRIES = 3
+
+ZIP_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 CREATOR_REFERENCE = "https://github.com/tanrbobanr/dpy-devtools"
 
 M_COMMAND_LOCKED = "This command is currently locked."
@@ -13,7 +13,7 @@ __copyright__ = "Copyright (c) 2022-present Tanner B. Corcoran"
 import enum
 
 
-class ControlGroupOptions(enum.Enum):
+class ControlGroupOptions(enum.StrEnum):
     disabled="disabled"
     enabled="enabled"
     inherit="inherit"
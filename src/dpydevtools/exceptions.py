@@ -9,7 +9,13 @@ __license__ = "MIT License"
 __copyright__ = "Copyright (c) 2022-present Tanner B. Corcoran"
 
 
+import typing
+
+
 class ContainerException(Exception):
-    def __init__(self, messages: list[str]) -> None:
-        self.messages = messages
-        super().__init__()
+    def __init__(self, messages: typing.Iterable[str]) -> None:
+        self.messages = tuple(messages)
+        super().__init__(self.messages)
+
+    def __str__(self) -> str:
+        return "".join(self.messages)
@@ -8,108 +8,221 @@ __author__ = "Tanner B. Corcoran"
 __license__ = "MIT License"
 __copyright__ = "Copyright (c) 2022-present Tanner B. Corcoran"
 
-import argparse
 from . import exceptions
+from . import enums
+import functools
+import argparse
+
+_METAVAR__NAME = ("<name>",)
+_METAVAR__VALUE = ("<value>",)
+_METAVAR__NAME_VALUE = ("<name>", "<value>")
+_METAVAR__NAME_USERID = ("<name>", "<userid>")
+_METAVAR__GUILDIDS = ("<guildid>", "<guildid>")
+_METAVAR__SUBPATH = ("<subpath>",)
+
+class Action__NameUserID(argparse.Action):
+    """Validates the `<userid>` of a `<name> <userid>` pair so that a bad
+    value is reported against the subcommand's usage.
+
+    """
+    def __call__(self, parser: argparse.ArgumentParser,
+                 namespace: argparse.Namespace, values: list,
+                 option_string: str = None) -> None:
+        userid = values[1]
+        digits = userid[1:] if userid[:1] == "-" else userid
+        if not digits.isdecimal():
+            raise argparse.ArgumentError(self, "argument 2 must be an integer")
+        setattr(namespace, self.dest, values)
+
+
+_KWARGS__CONST = {"action": "store_const", "const": ()}
+_KWARGS__NAME = {"nargs": 1, "metavar": _METAVAR__NAME}
+_KWARGS__NAME_USERID = {"action": Action__NameUserID, "nargs": 2, "metavar": _METAVAR__NAME_USERID}
+_KWARGS__GUILDIDS = {"nargs": "+", "metavar": _METAVAR__GUILDIDS}
+_KWARGS__SUBPATH = {"nargs": "*", "metavar": _METAVAR__SUBPATH}
+
+_CHOICES__CONTROL_GROUP_OPTIONS = tuple(o.value for o in enums.ControlGroupOptions)
+
+# (option strings, dest, help, add_argument kwargs)
+_ARGS__BOT = (
+    (("-x", "--close"), "_bot__close", "close the bot", _KWARGS__CONST),
+    (("-u", "--uptime"), "_bot__uptime", "get the uptime of the bot", _KWARGS__CONST),
+    (("--update-requirements",), "_bot__update_requirements", "update the requirements.txt file", _KWARGS__CONST),
+    (("--reload-module",), "_bot__reload_module", "reload the given module", {"nargs": 1, "metavar": ("<module_name_startswith>",)}),
+)
+
+_ARGS__CONTROL_GROUPS = (
+    (("-l", "--list"), "_control_groups__list", "list all control groups and their current values", _KWARGS__CONST),
+    (("-E", "--edit-all"), "_control_groups__edit_all", "edit all control groups and set them to <value>", {"type": str, "nargs": 1, "choices": _CHOICES__CONTROL_GROUP_OPTIONS, "metavar": _METAVAR__VALUE}),
+    (("-e", "--edit"), "_control_groups__edit", "edit a control group's value", {"type": str, "nargs": 2, "metavar": _METAVAR__NAME_VALUE}),
+)
+
+_ARGS__CONTROL_WHITELISTS = (
+    (("-l", "--list"), "_control_whitelists__list", "list all whitelist groups", _KWARGS__CONST),
+    (("-g", "--get"), "_control_whitelists__get", "list all users in the given whitelist", _KWARGS__NAME),
+    (("-a", "--add"), "_control_whitelists__add", "add a user to the given whitelist", _KWARGS__NAME_USERID),
+    (("-r", "--remove"), "_control_whitelists__remove", "remove a user from the given whitelist", _KWARGS__NAME_USERID),
+)
+
+_ARGS__CONTROL_BLACKLISTS = (
+    (("-l", "--list"), "_control_blacklists__list", "list all blacklist groups", _KWARGS__CONST),
+    (("-g", "--get"), "_control_blacklists__get", "list all users in the given blacklist", _KWARGS__NAME),
+    (("-a", "--add"), "_control_blacklists__add", "add a user to the given blacklist", _KWARGS__NAME_USERID),
+    (("-r", "--remove"), "_control_blacklists__remove", "remove a user from the given blacklist", _KWARGS__NAME_USERID),
+)
+
+_ARGS__EXTENSIONS = (
+    (("-l", "--list"), "_extensions__list", "list all current extensions", _KWARGS__CONST),
+    (("-R", "--reload-all"), "_extensions__reload_all", "reload all extensions", _KWARGS__CONST),
+    (("-r", "--reload"), "_extensions__reload", "reload an extension", _KWARGS__NAME),
+    (("-U", "--unload-all"), "_extensions__unload_all", "unload all extensions", _KWARGS__CONST),
+    (("-u", "--unload"), "_extensions__unload", "unload an extension", _KWARGS__NAME),
+    (("-L", "--load-all"), "_extensions__load_all", "load all extensions", _KWARGS__CONST),
+    (("-d", "--load"), "_extensions__load", "load an extension", _KWARGS__NAME),
+)
+
+_ARGS__SYNC = (
+    (("-G", "--guilds"), "_sync__guilds", "sync the local command tree to one or more guilds (as guild IDs)", _KWARGS__GUILDIDS),
+    (("-c", "--current"), "_sync__current", "sync the local command tree to the current guild", _KWARGS__CONST),
+    (("-g", "--global"), "_sync__global", "sync the local command tree to all guilds", _KWARGS__CONST),
+    (("-p", "--copy-global-current"), "_sync__copy_global_current", "copy global commands in local command tree to the current guild", _KWARGS__CONST),
+    (("-P", "--copy-global"), "_sync__copy_global", "copy global commands in local command tree to one or more guilds (as guild IDs)", _KWARGS__GUILDIDS),
+    (("-C", "--clear"), "_sync__clear_global", "clear all global commands from the local command tree", _KWARGS__CONST),
+    (("-x", "--clear-current"), "_sync__clear_current", "clear all commands from the local command tree of the current guild", _KWARGS__CONST),
+    (("-X", "--clear-guilds"), "_sync__clear_guilds", "clear the local command tree for one or more guilds (as guild IDs)", _KWARGS__GUILDIDS),
+)
+
+_ARGS__GIT = (
+    (("--pull",), "_git__pull", "run git pull", _KWARGS__CONST),
+)
+
+_ARGS__COMMANDS = (
+    (("-l", "--list"), "_commands__list", "list the current commands", _KWARGS__CONST),
+)
+
+_ARGS__TRACKERS = (
+    (("-l", "--list"), "_trackers__list", "list all command trackers", _KWARGS__CONST),
+    (("-g", "--get"), "_trackers__get", "get information from a command tracker", _KWARGS__NAME),
+)
+
+_ARGS__FILES = (
+    (("-l", "--list"), "_files__list", "list files and directories in the master path or given subpath", _KWARGS__SUBPATH),
+    (("-d", "--download"), "_files__download", "download the file or directory specified by the master path or given subpath", _KWARGS__SUBPATH),
+    (("-u", "--upload"), "_files__upload", "upload the file or directory specified by the master path or given subpath with a file (sent afterwards)", _KWARGS__SUBPATH),
+    (("-r", "--remove"), "_files__remove", "remove the file or directory specified by the master path or given subpath", _KWARGS__SUBPATH),
+)
+
+# (name, aliases, description, arguments)
+_SUBPARSERS = (
+    ("control-groups", ("cg",), "manage control groups", _ARGS__CONTROL_GROUPS),
+    ("control-whitelists", ("cw",), "manage whitelists", _ARGS__CONTROL_WHITELISTS),
+    ("control-blacklists", ("cb",), "manage blacklists", _ARGS__CONTROL_BLACKLISTS),
+    ("extensions", ("e",), "load, unload, and reload extensions", _ARGS__EXTENSIONS),
+    ("sync", ("s",), "sync commands", _ARGS__SYNC),
+    ("git", ("g",), "run git commands", _ARGS__GIT),
+    ("commands", ("c",), "command information", _ARGS__COMMANDS),
+    ("trackers", ("t",), "get information from command trackers", _ARGS__TRACKERS),
+    ("files", ("f",), "navigate, download, or replace files in the designated directory", _ARGS__FILES),
+)
 
 
 class CustomParser(argparse.ArgumentParser):
     def __init__(self, *args, **kwargs) -> None:
         self._messages: list[str] = []
+        self._append_message = self._messages.append
+        self._flag_actions: dict[str, argparse.Action] | None = None
         super().__init__(*args, **kwargs)
 
+    def _get_flag_actions(self) -> dict[str, argparse.Action]:
+        # option strings of the constant-storing flags; empty if anything is
+        # required, since the fast path skips argparse's required checks
+        if self._flag_actions is None:
+            if (any(a.required for a in self._actions)
+                or any(g.required for g in self._mutually_exclusive_groups)):
+                self._flag_actions = {}
+            else:
+                self._flag_actions = {
+                    option: action for action in self._actions
+                    if isinstance(action, argparse._StoreConstAction)
+                    for option in action.option_strings}
+        return self._flag_actions
+
+    def parse_args(self, args=None, namespace=None):
+        # a single flag (e.g. `-u`) is resolved without a full parse
+        if args is not None and namespace is None and len(args) == 1:
+            action = self._get_flag_actions().get(args[0])
+            if action is not None:
+                namespace = argparse.Namespace()
+                setattr(namespace, action.dest, action.const)
+                return namespace
+        return super().parse_args(args, namespace)
+
     def _print_message(self, message, file=None):
         if message:
-            self._messages.append(message)
+            self._append_message(message)
     
     def exit(self, status=0, message=None):
         if message:
-            self._messages.append(message)
-        messages = self._messages.copy()
+            self._append_message(message)
+        messages = self._messages
         self._messages = []
+        self._append_message = self._messages.append
         raise exceptions.ContainerException(messages)
 
 
-class Action__StrInt(argparse.Action):
+class Action__LazySubParsers(argparse._SubParsersAction):
+    """A subparsers action that only builds a subparser once it is selected.
+    The name, aliases and help are registered up front so that choice
+    validation and the top-level help stay unchanged.
+
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        self._builders: dict[str, tuple] = {}
+        super().__init__(*args, **kwargs)
+
+    def add_lazy_parser(self, name: str, builder, **kwargs) -> None:
+        if kwargs.get("prog") is None:
+            kwargs["prog"] = f"{self._prog_prefix} {name}"
+        aliases = tuple(kwargs.pop("aliases", ()))
+        if "help" in kwargs:
+            self._choices_actions.append(
+                self._ChoicesPseudoAction(name, aliases, kwargs.pop("help")))
+        spec = (builder, (name, *aliases), kwargs)
+        for n in spec[1]:
+            self._builders[n] = spec
+            self._name_parser_map[n] = None
+
+    def _build(self, name: str) -> None:
+        spec = self._builders.get(name)
+        if spec is None:
+            return
+        builder, names, kwargs = spec
+        parser = self._parser_class(**kwargs)
+        builder(parser)
+        for n in names:
+            del self._builders[n]
+            self._name_parser_map[n] = parser
+
     def __call__(self, parser: argparse.ArgumentParser,
                  namespace: argparse.Namespace, values: list,
                  option_string: str = None) -> None:
-        _str, _int = values
-        try:
-            _int = int(_int)
-        except ValueError:
-            raise argparse.ArgumentError(self, f"argument 2 must be an integer")
-        setattr(namespace, self.dest, (_str, _int))
+        self._build(values[0])
+        super().__call__(parser, namespace, values, option_string)
+
 
+def _add_arguments(parser: CustomParser, arguments: tuple,
+                   required: bool = True) -> None:
+    group = parser.add_mutually_exclusive_group(required=required)
+    for option_strings, dest, help, kwargs in arguments:
+        group.add_argument(*option_strings, dest=dest, help=help, **kwargs)
 
+
+@functools.lru_cache(maxsize=None)
 def make_parser(prog: str) -> CustomParser:
     PARSER = CustomParser(prog, description="developer and administrator tools for discord.py")
-    PARSER__SUBPARSER = PARSER.add_subparsers()
-
-    PARSER_ME = PARSER.add_mutually_exclusive_group()
-    PARSER_ME.add_argument("-x", "--close", dest="_bot__close", help="close the bot", action="store_const", const=())
-    PARSER_ME.add_argument("-u", "--uptime", dest="_bot__uptime", help="get the uptime of the bot", action="store_const", const=())
-    PARSER_ME.add_argument("--update-requirements", dest="_bot__update_requirements", help="update the requirements.txt file", action="store_const", const=())
-    PARSER_ME.add_argument("--reload-module", dest="_bot__reload_module", help="reload the given module", nargs=1, metavar=("<module_name_startswith>",))
-
-    CG = PARSER__SUBPARSER.add_parser("control-groups", aliases=["cg"], description="manage control groups", help="manage control groups")
-    CG_ME = CG.add_mutually_exclusive_group(required=True)
-    CG_ME.add_argument("-l", "--list", dest="_control_groups__list", help="list all control groups and their current values", action="store_const", const=())
-    CG_ME.add_argument("-E", "--edit-all", dest="_control_groups__edit_all", help="edit all control groups and set them to <value>", type=str, nargs=1, metavar=("<value>",))
-    CG_ME.add_argument("-e", "--edit", dest="_control_groups__edit", help="edit a control group's value", type=str, nargs=2, metavar=("<name>", "<value>"))
-
-    CW = PARSER__SUBPARSER.add_parser("control-whitelists", aliases=["cw"], description="manage whitelists", help="manage whitelists")
-    CW_ME = CW.add_mutually_exclusive_group(required=True)
-    CW_ME.add_argument("-l", "--list", dest="_control_whitelists__list", help="list all whitelist groups", action="store_const", const=())
-    CW_ME.add_argument("-g", "--get", dest="_control_whitelists__get", help="list all users in the given whitelist", nargs=1, metavar=("<name>",))
-    CW_ME.add_argument("-a", "--add", dest="_control_whitelists__add", help="add a user to the given whitelist", action=Action__StrInt, nargs=2, metavar=("<name>", "<userid>"))
-    CW_ME.add_argument("-r", "--remove", dest="_control_whitelists__remove", help="remove a user from the given whitelist", action=Action__StrInt, nargs=2, metavar=("<name>", "<userid>"))
-
-    CB = PARSER__SUBPARSER.add_parser("control-blacklists", aliases=["cb"], description="manage blacklists", help="manage blacklists")
-    CB_ME = CB.add_mutually_exclusive_group(required=True)
-    CB_ME.add_argument("-l", "--list", dest="_control_blacklists__list", help="list all blacklist groups", action="store_const", const=())
-    CB_ME.add_argument("-g", "--get", dest="_control_blacklists__get", help="list all users in the given blacklist", nargs=1, metavar=("<name>",))
-    CB_ME.add_argument("-a", "--add", dest="_control_blacklists__add", help="add a user to the given blacklist", action=Action__StrInt, nargs=2, metavar=("<name>", "<userid>"))
-    CB_ME.add_argument("-r", "--remove", dest="_control_blacklists__remove", help="remove a user from the given blacklist", action=Action__StrInt, nargs=2, metavar=("<name>", "<userid>"))
-
-    E = PARSER__SUBPARSER.add_parser("extensions", aliases=["e"], description="load, unload, and reload extensions", help="load, unload, and reload extensions")
-    E_ME = E.add_mutually_exclusive_group(required=True)
-    E_ME.add_argument("-l", "--list", dest="_extensions__list", help="list all current extensions", action="store_const", const=())
-    E_ME.add_argument("-R", "--reload-all", dest="_extensions__reload_all", help="reload all extensions", action="store_const", const=())
-    E_ME.add_argument("-r", "--reload", dest="_extensions__reload", help="reload an extension", nargs=1, metavar=("<name>",))
-    E_ME.add_argument("-U", "--unload-all", dest="_extensions__unload_all", help="unload all extensions", action="store_const", const=())
-    E_ME.add_argument("-u", "--unload", dest="_extensions__unload", help="unload an extension", nargs=1, metavar=("<name>",))
-    E_ME.add_argument("-L", "--load-all", dest="_extensions__load_all", help="load all extensions", action="store_const", const=())
-    E_ME.add_argument("-d", "--load", dest="_extensions__load", help="load an extension", nargs=1, metavar=("<name>",))
-
-    S = PARSER__SUBPARSER.add_parser("sync", aliases=["s"], description="sync commands", help="sync commands")
-    S_ME = S.add_mutually_exclusive_group(required=True)
-    S_ME.add_argument("-G", "--guilds", dest="_sync__guilds", help="sync the local command tree to one or more guilds (as guild IDs)", nargs="+", metavar=("<guildid>", "<guildid>"))
-    S_ME.add_argument("-c", "--current", dest="_sync__current", help="sync the local command tree to the current guild", action="store_const", const=())
-    S_ME.add_argument("-g", "--global", dest="_sync__global", help="sync the local command tree to all guilds", action="store_const", const=())
-    S_ME.add_argument("-p", "--copy-global-current", dest="_sync__copy_global_current", help="copy global commands in local command tree to the current guild", action="store_const", const=())
-    S_ME.add_argument("-P", "--copy-global", dest="_sync__copy_global", help="copy global commands in local command tree to one or more guilds (as guild IDs)", nargs="+", metavar=("<guildid>", "<guildid>"))
-    S_ME.add_argument("-C", "--clear", dest="_sync__clear_global", help="clear all global commands from the local command tree", action="store_const", const=())
-    S_ME.add_argument("-x", "--clear-current", dest="_sync__clear_current", help="clear all commands from the local command tree of the current guild", action="store_const", const=())
-    S_ME.add_argument("-X", "--clear-guilds", dest="_sync__clear_guilds", help="clear the local command tree for one or more guilds (as guild IDs)", nargs="+", metavar=("<guildid>", "<guildid>"))
-
-    G = PARSER__SUBPARSER.add_parser("git", aliases=["g"], description="run git commands", help="run git commands")
-    G_ME = G.add_mutually_exclusive_group(required=True)
-    G_ME.add_argument("--pull", dest="_git__pull", help="run git pull", action="store_const", const=())
-    
-    C = PARSER__SUBPARSER.add_parser("commands", aliases=["c"], description="command information", help="command information")
-    C_ME = C.add_mutually_exclusive_group(required=True)
-    C_ME.add_argument("-l", "--list", dest="_commands__list", help="list the current commands", action="store_const", const=())
-
-    T = PARSER__SUBPARSER.add_parser("trackers", aliases=["t"], description="get information from command trackers", help="get information from command trackers")
-    T_ME = T.add_mutually_exclusive_group(required=True)
-    T_ME.add_argument("-l", "--list", dest="_trackers__list", help="list all command trackers", action="store_const", const=())
-    T_ME.add_argument("-g", "--get", dest="_trackers__get", help="get information from a command tracker", nargs=1, metavar=("<name>",))
-    
-    F = PARSER__SUBPARSER.add_parser("files", aliases=["f"], description="navigate, download, or replace files in the designated directory", help="navigate, download, or replace files in the designated directory")
-    F_ME = F.add_mutually_exclusive_group(required=True)
-    F_ME.add_argument("-l", "--list", dest="_files__list", help="list files and directories in the master path or given subpath", nargs="*", metavar=("<subpath>",))
-    F_ME.add_argument("-d", "--download", dest="_files__download", help="download the file or directory specified by the master path or given subpath", nargs="*", metavar=("<subpath>",))
-    F_ME.add_argument("-u", "--upload", dest="_files__upload", help="upload the file or directory specified by the master path or given subpath with a file (sent afterwards)", nargs="*", metavar=("<subpath>",))
-    F_ME.add_argument("-r", "--remove", dest="_files__remove", help="remove the file or directory specified by the master path or given subpath", nargs="*", metavar=("<subpath>",))
-    
+    PARSER__SUBPARSER = PARSER.add_subparsers(action=Action__LazySubParsers)
+    _add_arguments(PARSER, _ARGS__BOT, required=False)
+    for name, aliases, description, arguments in _SUBPARSERS:
+        PARSER__SUBPARSER.add_lazy_parser(name, functools.partial(_add_arguments, arguments=arguments),
+                                          aliases=aliases, description=description, help=description)
     return PARSER
@@ -19,13 +19,13 @@ import collections
 import subprocess
 import functools
 import importlib
-import datetime
+import itertools
+import asyncio
 import discord
 import logging
 import pathlib
-import zipfile
+import secrets
 import random
-import string
 import time
 import sys
 import os
@@ -35,6 +35,35 @@ import io
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_cg_option(__value: str) -> enums.ControlGroupOptions | None:
+    try:
+        return enums.ControlGroupOptions(__value)
+    except ValueError:
+        return None
+
+
+def _parse_userid(__parser: parser.CustomParser, __userid: str) -> int:
+    digits = __userid[1:] if __userid[:1] == "-" else __userid
+    if not digits.isdecimal():
+        __parser.error(f"userid '{__userid}' is not integer parsable")
+    return int(__userid)
+
+
+def _retry_after(__exc: Exception) -> float | None:
+    # the delay requested by a rate limit, or None if `__exc` is not one;
+    # discord.py raises RateLimited itself once its own retries would wait too
+    # long, while a bare 429 HTTPException only carries the response headers
+    if isinstance(__exc, discord.RateLimited):
+        return __exc.retry_after
+    if isinstance(__exc, discord.HTTPException) and __exc.status == 429:
+        try:
+            return float(__exc.response.headers["Retry-After"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return 1.0
+    return None
+
+
 class ControlGroups:
     """Container for command control groups.
     
@@ -44,10 +73,13 @@ class ControlGroups:
                  __developers: list[int] = None,
                  __cg_defaults: dict[str, enums.ControlGroupOptions] = None
                  ) -> None:
-        self._moderators = __moderators or []
-        self._administrators = __administrators or []
-        self._developers = __developers or []
+        self._moderators = frozenset(__moderators or ())
+        self._administrators = frozenset(__administrators or ())
+        self._developers = frozenset(__developers or ())
+        self._adminplus = self._administrators | self._developers
+        self._modplus = self._moderators | self._adminplus
         self._groups = {"global": enums.ControlGroupOptions.enabled}
+        self._version = 0
         if __cg_defaults:
             self._groups.update(__cg_defaults)
             self._ensure_default_validity()
@@ -62,11 +94,16 @@ class ControlGroups:
         _logger.debug("acquiring control group %s", __key)
         if __key is None:
             return
-        if __key not in self._groups:
-            _logger.debug("creating control group %s with default of inherit",
-                          __key)
-            self._groups[__key] = enums.ControlGroupOptions.inherit
+        self._ensure(__key)
         return self._groups[__key]
+
+    def _ensure(self, __key: str | None, /) -> None:
+        if __key is None or __key in self._groups:
+            return
+        _logger.debug("creating control group %s with default of inherit",
+                      __key)
+        self._groups[__key] = enums.ControlGroupOptions.inherit
+        self._version += 1
     
     def __setitem__(self, __key: str,
                     __value: enums.ControlGroupOptions, /) -> None:
@@ -75,36 +112,40 @@ class ControlGroups:
             raise ValueError(f"\"{__value}\" is not a valid control group "
                              "option")
         self._groups[__key] = __value
+        self._version += 1
     
     def check(self, __group: str, __userid: int, /) -> bool:
         _logger.debug("initiating control group (%s) check for %s", __group,
                       __userid)
         cgvalue = self[__group]
-        if cgvalue == enums.ControlGroupOptions.inherit:
+        if cgvalue is enums.ControlGroupOptions.inherit:
             cgvalue = self["global"]
 
-        if cgvalue == enums.ControlGroupOptions.inherit:
+        if cgvalue is enums.ControlGroupOptions.inherit:
             return True
-        if cgvalue == enums.ControlGroupOptions.enabled:
+        if cgvalue is enums.ControlGroupOptions.enabled:
             return True
-        if (cgvalue == enums.ControlGroupOptions.modplus and __userid in
-            self._moderators + self._administrators + self._developers):
+        if (cgvalue is enums.ControlGroupOptions.modplus and __userid in
+            self._modplus):
             return True
-        if (cgvalue == enums.ControlGroupOptions.adminplus and __userid in
-            self._administrators + self._developers):
+        if (cgvalue is enums.ControlGroupOptions.adminplus and __userid in
+            self._adminplus):
             return True
-        if (cgvalue == enums.ControlGroupOptions.devonly and __userid in
+        if (cgvalue is enums.ControlGroupOptions.devonly and __userid in
             self._developers):
             return True
         return False
 
 
 class UserGroups:
-    """Container for command user groups (whitelist/blacklist).
+    """Container for command user groups (whitelist/blacklist). Each group is
+    stored as an insertion-ordered dict of userids (values are unused).
     
     """
     def __init__(self, __defaults: dict[str, list[int]] = None) -> None:
-        self._groups = __defaults or {}
+        self._groups: dict[str, dict[int, None]] = {
+            k: dict.fromkeys(v) for k, v in (__defaults or {}).items()}
+        self._version = 0
         if __defaults:
             self._ensure_default_validity()
 
@@ -115,14 +156,29 @@ class UserGroups:
                 if not isinstance(_v, int):
                     raise ValueError("\"{_v}\" must be integer parsable")
 
-    def __getitem__(self, __key: str, /) -> list[int]:
+    def __getitem__(self, __key: str, /) -> dict[int, None]:
         _logger.debug("acquiring user group %s", __key)
         if __key is None:
             return
-        if __key not in self._groups:
-            _logger.debug("creating user group %s", __key)
-            self._groups[__key] = []
+        self._ensure(__key)
         return self._groups[__key]
+
+    def _ensure(self, __key: str | None, /) -> None:
+        if __key is None or __key in self._groups:
+            return
+        _logger.debug("creating user group %s", __key)
+        self._groups[__key] = {}
+        self._version += 1
+
+    def add(self, __group: str, __userid: int, /) -> None:
+        _logger.debug("adding %s to user group %s", __userid, __group)
+        self[__group][__userid] = None
+        self._version += 1
+
+    def remove(self, __group: str, __userid: int, /) -> None:
+        _logger.debug("removing %s from user group %s", __userid, __group)
+        del self[__group][__userid]
+        self._version += 1
     
     def check(self, __group: str, __userid: int, /) -> bool:
         if __userid in self[__group]:
@@ -142,11 +198,14 @@ class TrackingSession:
     
     async def __aenter__(self) -> None:
         _logger.debug("entering tracking session (%s)", self._entry)
-        self._tracker._active.append(self._entry)
+        self._tracker._active[self._entry] += 1
     
     async def __aexit__(self, exc, exc_type, exc_tb) -> None:
         _logger.debug("exiting tracking session (%s)", self._entry)
-        self._tracker._active.remove(self._entry)
+        active = self._tracker._active
+        active[self._entry] -= 1
+        if not active[self._entry]:
+            del active[self._entry]
 
 
 class Tracker:
@@ -154,22 +213,25 @@ class Tracker:
     
     """
     def __init__(self) -> None:
-        self._active: list[str] = []
-        self._history: collections.deque[str] = collections.deque(maxlen=15)
+        self._active: collections.Counter[str] = collections.Counter()
+        # (userid, timestamp) pairs; only formatted when they are displayed
+        self._history: collections.deque[tuple[int, float]] = \
+            collections.deque(maxlen=15)
         self._counts: dict[int, int] = {}
     
     def __call__(self, __guildid: int, __userid: int) -> TrackingSession:
-        if __guildid not in self._counts:
-            _logger.debug("creating new tracker count for guild %s", __guildid)
-            self._counts[__guildid] = 1
-        else:
-            _logger.debug("incrementing tracker count for guild %s", __guildid)
-            self._counts[__guildid] += 1
-        datestr = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-        self._history.append(f"{__userid}@{datestr}")
+        _logger.debug("incrementing tracker count for guild %s", __guildid)
+        self._counts[__guildid] = self._counts.get(__guildid, 0) + 1
+        self._history.append((__userid, time.time()))
         _logger.debug("creating new tracking session")
         return TrackingSession(self, __guildid, __userid)
 
+    @staticmethod
+    def _format_history_entry(__userid: int, __timestamp: float) -> str:
+        t = time.gmtime(__timestamp)
+        return (f"{__userid}@{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
 
 class TrackerGroups:
     """A container for trackers.
@@ -182,11 +244,15 @@ class TrackerGroups:
         _logger.debug("acquiring tracker %s", __key)
         if __key is None:
             return
-        if __key not in self._groups:
-            _logger.debug("creating tracker %s", __key)
-            self._groups[__key] = Tracker()
+        self._ensure(__key)
         return self._groups[__key]
 
+    def _ensure(self, __key: str | None, /) -> None:
+        if __key is None or __key in self._groups:
+            return
+        _logger.debug("creating tracker %s", __key)
+        self._groups[__key] = Tracker()
+
 
 class NamedBuffer(io.BufferedReader):
     def __init__(self, name: str, raw: io.RawIOBase) -> None:
@@ -257,6 +323,7 @@ class DevTools:
         utils.setup_logging(_logger, log_level)
         self._start_ts = time.time()
         self._prog = prog
+        self._parser = parser.make_parser(prog)
         self._controller = controller
         self._control_groups = ControlGroups(cg_moderators, cg_administrators,
                                              cg_developers, cg_defaults)
@@ -264,10 +331,25 @@ class DevTools:
         self._control_blacklists = UserGroups(cb_defaults)
         self._trackers = TrackerGroups(tracker_defaults)
         self._extensions_path = extensions_path and pathlib.Path(extensions_path)
+        self._ext_pkg = self._extensions_path and ".".join(self._extensions_path.parts)
         self._files_path = files_path and pathlib.Path(files_path)
         self._requirements_path = requirements_path and pathlib.Path(requirements_path)
+        # per instance, so the cache neither outlives nor is shared between
+        # instances; the versions only take part in the cache key
+        self._cached_check = functools.lru_cache(maxsize=4096)(
+                lambda versions, cg, cw, cb, userid:
+                self._resolve_check(cg, cw, cb, userid))
     
     def _check(self, __cg: str, __cw: str, __cb: str, __userid: int) -> bool:
+        # the container versions change on every mutation, which keeps stale
+        # results from being returned without having to clear the cache
+        versions = (self._control_groups._version,
+                    self._control_whitelists._version,
+                    self._control_blacklists._version)
+        return self._cached_check(versions, __cg, __cw, __cb, __userid)
+
+    def _resolve_check(self, __cg: str, __cw: str, __cb: str,
+                       __userid: int) -> bool:
         _logger.debug("beginning check -> cg=%s cw=%s cb=%s userid=%s", __cg,
                       __cw, __cb, __userid)
         if not __cg and not __cw and not __cb:
@@ -325,10 +407,10 @@ class DevTools:
         _logger.debug("creating command/menu decorator -> group=%s, "
                            "whitelist=%s, blacklist=%s, tracker=%s, ignore=%s",
                            group, whitelist, blacklist, tracker, ignore)
-        self._control_groups[group]
-        self._control_whitelists[whitelist]
-        self._control_blacklists[blacklist]
-        self._trackers[tracker]
+        self._control_groups._ensure(group)
+        self._control_whitelists._ensure(whitelist)
+        self._control_blacklists._ensure(blacklist)
+        self._trackers._ensure(tracker)
 
         def decorator(cmd):
             if not ignore and not isinstance(cmd, (commands.Command,
@@ -338,21 +420,24 @@ class DevTools:
                                  "instance")
             _logger.debug("decorating command/menu %s",
                           getattr(cmd, "name", None) or cmd.__name__)
+            # nothing to control or track, so there is nothing to wrap
+            if (group is None and whitelist is None and blacklist is None
+                and tracker is None):
+                return cmd
+            controlled = bool(group or whitelist or blacklist)
             @functools.wraps(cmd)
             async def wrapper(*args, **kwargs):
-                if (group is None and whitelist is None and blacklist is None
-                    and tracker is None) or not args:
+                if not args:
                     return await cmd(*args, **kwargs)
                 utx = utils.get_utx(args)
                 userid = utils.get_user_id(utx)
-                guildid = utils.get_guild_id(utx)
-                sender = utils.get_sender(utx)
-                passed = self._check(group, whitelist, blacklist, userid)
-                if not passed:
+                if controlled and not self._check(group, whitelist, blacklist,
+                                                  userid):
                     embed = utils.make_message._neg(constants.M_COMMAND_LOCKED)
-                    await sender(embed=embed)
+                    await utils.get_sender(utx)(embed=embed)
                     return
                 if tracker:
+                    guildid = utils.get_guild_id(utx)
                     async with self._trackers[tracker](guildid, userid) as _:
                         return await cmd(*args, **kwargs)
                 return await cmd(*args, **kwargs)
@@ -381,8 +466,16 @@ class DevTools:
         """
         _logger.debug("resolving placeholders for %s",
                       obj.__class__.__name__)
-        for name in dir(obj):
-            child = getattr(obj, name)
+        # walk the raw namespaces instead of getattr-ing everything in
+        # dir(obj), which would trigger properties and other descriptors;
+        # the instance comes first since cogs store their command copies there
+        namespaces = [getattr(obj, "__dict__", {})]
+        namespaces.extend(vars(cls) for cls in type(obj).__mro__)
+        seen: set[str] = set()
+        for name, child in ((n, c) for ns in namespaces for n, c in ns.items()):
+            if name in seen:
+                continue
+            seen.add(name)
 
             # skip if child isn't able to be decorated
             # with our decorator anyway
@@ -420,7 +513,7 @@ class DevTools:
         """The function to be used as the controller command.
         
         """
-        _parser = parser.make_parser(self._prog)
+        _parser = self._parser
         try:
             parsed = _parser.parse_args(queries)
             func = None
@@ -460,28 +553,33 @@ class DevTools:
         vers = sys.version_info
         args = ("py", f"-{vers.major}.{vers.minor}", "-m", "pip", "install", "-U", "-r",
                 str(self._requirements_path))
-        process = subprocess.Popen(args, stdout=subprocess.PIPE)
-        output = process.communicate()[0]
-        if not output:
+        process = await asyncio.create_subprocess_exec(*args, stdout=subprocess.PIPE)
+        output = io.BytesIO()
+        while chunk := await process.stdout.read(io.DEFAULT_BUFFER_SIZE):
+            output.write(chunk)
+        await process.wait()
+        if not output.tell():
             await ctx.send(embed=utils.make_message._neg("Requirements path is invalid."))
             return
+        output.seek(0)
         await ctx.send(embed=utils.make_message._pos("Requirements updated."))
-        await ctx.send(file=discord.File(io.BytesIO(output), "log.txt"))
+        await ctx.send(file=discord.File(output, "log.txt"))
     
     async def _bot__reload_module(self, parser_: parser.CustomParser, ctx: commands.Context,
                                   module: str) -> None:
         errors: list[tuple[str, str]] = []
         total_found = 0
-        current_modules = list(sys.modules.values())
-        for m in current_modules:
+        # collect the names first since reloading may import new modules
+        names = [n for n in list(sys.modules) if n.startswith(module)]
+        for name in names:
+            m = sys.modules.get(name)
             if m is None:
                 continue
-            if m.__name__.startswith(module):
-                total_found += 1
-                try:
-                    importlib.reload(m)
-                except Exception as exc:
-                    errors.append((m.__name__, str(exc)))
+            total_found += 1
+            try:
+                importlib.reload(m)
+            except Exception as exc:
+                errors.append((name, str(exc)))
         
         if not errors:
             embed = utils.make_message._pos(f"Reloaded {total_found} of {total_found} module(s).")
@@ -495,23 +593,23 @@ class DevTools:
 
     async def _control_groups__list(self, parser_: parser.CustomParser,
                                     ctx: commands.Context) -> None:
-        max_key_len = max(len(k) for k in self._control_groups._groups.keys())
-        max_val_len = max(len(v.value) for v in
-                          self._control_groups._groups.values())
-        body = "\n".join(f"{k: <{max_key_len}} -> {v.value: >{max_val_len}}"
-                        for k, v in self._control_groups._groups.items())
+        items: list[tuple[str, str]] = []
+        max_key_len = max_val_len = 0
+        for k, v in self._control_groups._groups.items():
+            v = v.value
+            items.append((k, v))
+            max_key_len = max(max_key_len, len(k))
+            max_val_len = max(max_val_len, len(v))
+        body = "\n".join(f"{k: <{max_key_len}} -> {v: >{max_val_len}}"
+                          for k, v in items)
         embed = utils.make_message._def(body)
         await ctx.send(embed=embed)
 
     async def _control_groups__edit_all(self, parser_: parser.CustomParser,
                                         ctx: commands.Context,
                                         __value: str) -> None:
-        try:
-            value = enums.ControlGroupOptions(__value)
-        except ValueError:
-            parser_.error(f"invalid choice: '{__value}' (choose from "
-                           "'disabled', 'enabled', 'inherit', 'modplus', "
-                           "'adminplus', 'devonly')")
+        # already validated through the parser's choices
+        value = _parse_cg_option(__value)
         for group in self._control_groups._groups:
             self._control_groups[group] = value
         embed = utils.make_message._pos(f"set {len(self._control_groups._groups)} "
@@ -521,9 +619,8 @@ class DevTools:
     async def _control_groups__edit(self, parser_: parser.CustomParser,
                                     ctx: commands.Context, __group: str,
                                     __value: str) -> None:
-        try:
-            value = enums.ControlGroupOptions(__value)
-        except ValueError:
+        value = _parse_cg_option(__value)
+        if value is None:
             parser_.error(f"invalid choice: '{__value}' (choose from "
                            "'disabled', 'enabled', 'inherit', 'modplus', "
                            "'adminplus', 'devonly')")
@@ -554,16 +651,13 @@ class DevTools:
     async def _control_whitelists__add(self, parser_: parser.CustomParser,
                                        ctx: commands.Context, __name: str,
                                        __userid: str) -> None:
-        try:
-            userid = int(__userid)
-        except ValueError:
-            parser_.error(f"userid '{__userid}' is not integer parsable")
+        userid = _parse_userid(parser_, __userid)
         if __name not in self._control_whitelists._groups:
             parser_.error(f"whitelist '{__name}' not found")
         if userid in self._control_whitelists[__name]:
             parser_.error(f"whitelist '{__name}' already contains the "
                            f"userid '{__userid}'")
-        self._control_whitelists[__name].append(userid)
+        self._control_whitelists.add(__name, userid)
         embed = utils.make_message._pos(f"userid '{__userid}' added to the whitelist"
                                   f" '{__name}'")
         await ctx.send(embed=embed)
@@ -571,16 +665,13 @@ class DevTools:
     async def _control_whitelists__remove(self, parser_: parser.CustomParser,
                                           ctx: commands.Context, __name: str,
                                           __userid: str) -> None:
-        try:
-            userid = int(__userid)
-        except ValueError:
-            parser_.error(f"userid '{__userid}' is not integer parsable")
+        userid = _parse_userid(parser_, __userid)
         if __name not in self._control_whitelists._groups:
             parser_.error(f"whitelist '{__name}' not found")
         if userid not in self._control_whitelists[__name]:
             parser_.error(f"whitelist '{__name}' does not contains the userid"
                            f" '{__userid}'")
-        self._control_whitelists[__name].remove(userid)
+        self._control_whitelists.remove(__name, userid)
         embed = utils.make_message._pos(f"userid '{__userid}' removed from the "
                                   "whitelist '{__name}'")
         await ctx.send(embed=embed)
@@ -604,16 +695,13 @@ class DevTools:
     async def _control_blacklists__add(self, parser_: parser.CustomParser,
                                        ctx: commands.Context, __name: str,
                                        __userid: str) -> None:
-        try:
-            userid = int(__userid)
-        except ValueError:
-            parser_.error(f"userid '{__userid}' is not integer parsable")
+        userid = _parse_userid(parser_, __userid)
         if __name not in self._control_blacklists._groups:
             parser_.error(f"blacklist '{__name}' not found")
         if userid in self._control_blacklists[__name]:
             parser_.error(f"blacklist '{__name}' already contains the userid"
                            f" '{__userid}'")
-        self._control_blacklists[__name].append(userid)
+        self._control_blacklists.add(__name, userid)
         embed = utils.make_message._pos(f"userid '{__userid}' added to the blacklist"
                                   f" '{__name}'")
         await ctx.send(embed=embed)
@@ -621,16 +709,13 @@ class DevTools:
     async def _control_blacklists__remove(self, parser_: parser.CustomParser,
                                           ctx: commands.Context, __name: str,
                                           __userid: str) -> None:
-        try:
-            userid = int(__userid)
-        except ValueError:
-            parser_.error(f"userid '{__userid}' is not integer parsable")
+        userid = _parse_userid(parser_, __userid)
         if __name not in self._control_blacklists._groups:
             parser_.error(f"blacklist '{__name}' not found")
         if userid not in self._control_blacklists[__name]:
             parser_.error(f"blacklist '{__name}' does not contains the userid"
                            f" '{__userid}'")
-        self._control_blacklists[__name].remove(userid)
+        self._control_blacklists.remove(__name, userid)
         embed = utils.make_message._pos(f"userid '{__userid}' removed from the "
                                   f"blacklist '{__name}'")
         await ctx.send(embed=embed)
@@ -649,14 +734,11 @@ class DevTools:
         num_extensions = len(self._controller.extensions)
         if num_extensions == 0:
             parser_.error("there are no loaded extensions to reload")
-        num_succeeded = 0
         ext_paths = list(self._controller.extensions.keys())
-        for e in ext_paths:
-            try:
-                await self._controller.reload_extension(e)
-                num_succeeded += 1
-            except Exception:
-                pass
+        num_succeeded = await utils.count_successes(
+                ((f"reloading extension '{e}'", self._controller.reload_extension(e))
+                 for e in ext_paths),
+                logger=_logger)
         embed = utils.make_message._pos(f"extensions reloaded: {num_succeeded}"
                                   f" of {num_extensions}")
         await ctx.send(embed=embed)
@@ -667,8 +749,7 @@ class DevTools:
             parser_.error("individual extension reloading is not possible "
                            "without 'extensions_path' being set in the "
                            "'AdminTools' instance")
-        ext_pkg = ".".join(self._extensions_path.parts)
-        ext_path = f"{ext_pkg}.{__name}"
+        ext_path = f"{self._ext_pkg}.{__name}"
         if ext_path not in self._controller.extensions:
             parser_.error(f"the extension '{ext_path}' is not currently loaded"
                            " and thus cannot be reloaded")
@@ -685,14 +766,11 @@ class DevTools:
         num_extensions = len(self._controller.extensions)
         if num_extensions == 0:
             parser_.error("there are no loaded extensions to unload")
-        num_succeeded = 0
         ext_paths = list(self._controller.extensions.keys())
-        for e in ext_paths:
-            try:
-                await self._controller.unload_extension(e)
-                num_succeeded += 1
-            except Exception:
-                pass
+        num_succeeded = await utils.count_successes(
+                ((f"unloading extension '{e}'", self._controller.unload_extension(e))
+                 for e in ext_paths),
+                logger=_logger)
         embed = utils.make_message._pos(f"extensions unloaded: {num_succeeded} of "
                                   f"{num_extensions}")
         await ctx.send(embed=embed)
@@ -703,8 +781,7 @@ class DevTools:
             parser_.error("individual extension unloading is not possible "
                            "without 'extensions_path' being set in the "
                            "'AdminTools' instance")
-        ext_pkg = ".".join(self._extensions_path.parts)
-        ext_path = f"{ext_pkg}.{__name}"
+        ext_path = f"{self._ext_pkg}.{__name}"
         if ext_path not in self._controller.extensions:
             parser_.error(f"the extension '{ext_path}' is not currently loaded"
                            " and thus cannot be unloaded")
@@ -726,13 +803,10 @@ class DevTools:
         num_extensions = len(paths)
         if not num_extensions:
             parser_.error("no extensions were found")
-        num_succeeded = 0
-        for p in paths:
-            try:
-                await self._controller.load_extension(p)
-                num_succeeded += 1
-            except Exception:
-                pass
+        num_succeeded = await utils.count_successes(
+                ((f"loading extension '{p}'", self._controller.load_extension(p))
+                 for p in paths),
+                logger=_logger)
         embed = utils.make_message._pos(f"extensions loaded: {num_succeeded} of "
                                   f"{num_extensions}")
         await ctx.send(embed=embed)
@@ -744,8 +818,7 @@ class DevTools:
                            "without 'extensions_path' being set in the "
                            "'AdminTools' instance")
         paths = utils._get_extensions(self._extensions_path)
-        ext_pkg = ".".join(self._extensions_path.parts)
-        ext_path = f"{ext_pkg}.{__name}"
+        ext_path = f"{self._ext_pkg}.{__name}"
         if ext_path not in paths:
             parser_.error(f"the extension '{ext_path}' does not exist")
         try:
@@ -758,15 +831,25 @@ class DevTools:
     async def _sync__guilds(self, parser_: parser.CustomParser,
                             ctx: commands.Context,
                             __guilds: tuple[str, ...]) -> None:
-        guilds_synced = 0
-        for guild_id in __guilds:
-            try:
-                await self._controller.tree.sync(
-                        guild=self._controller.get_guild(int(guild_id)))
-            except Exception:
-                pass
-            else:
-                guilds_synced += 1
+        async def sync(guild_id: str) -> None:
+            guild = self._controller.get_guild(int(guild_id))
+            for attempt in range(constants.SYNC_MAX_RETRIES + 1):
+                try:
+                    await self._controller.tree.sync(guild=guild)
+                    return
+                except (discord.RateLimited, discord.HTTPException) as exc:
+                    # retry rate limits after the advertised delay plus jitter;
+                    # anything else is logged by `count_successes`
+                    retry_after = _retry_after(exc)
+                    if retry_after is None or attempt == constants.SYNC_MAX_RETRIES:
+                        raise
+                    _logger.debug("rate limited syncing guild %s, retrying in %ss",
+                                  guild_id, retry_after)
+                    await asyncio.sleep(retry_after + random.random() * 0.1)
+
+        guilds_synced = await utils.count_successes(
+                ((f"syncing command tree to guild {g}", sync(g)) for g in __guilds),
+                logger=_logger)
         embed = utils.make_message._pos(f"synced command tree to {guilds_synced} of "
                                   f"{len(__guilds)} guilds")
         await ctx.send(embed=embed)
@@ -799,7 +882,7 @@ class DevTools:
         guilds_synced = 0
         for guild_id in __guilds:
             try:
-                await self._controller.tree.copy_global_to(
+                self._controller.tree.copy_global_to(
                         guild=self._controller.get_guild(int(guild_id)))
             except Exception:
                 pass
@@ -830,7 +913,7 @@ class DevTools:
         guilds_synced = 0
         for guild_id in __guilds:
             try:
-                await self._controller.tree.clear_commands(
+                self._controller.tree.clear_commands(
                         guild=self._controller.get_guild(int(guild_id)))
             except Exception:
                 pass
@@ -842,31 +925,32 @@ class DevTools:
 
     async def _git__pull(self, parser_: parser.CustomParser,
                          ctx: commands.Context) -> None:
-        process = subprocess.Popen(("git", "pull",
-                                    "--allow-unrelated-histories"),
-            stdout=subprocess.PIPE)
-        output = process.communicate()[0]
-        if output is None:
-            embed = utils.make_message._neg("already up to date")
+        process = await asyncio.create_subprocess_exec(
+                "git", "pull", "--allow-unrelated-histories",
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = await process.communicate()
+        if process.returncode:
+            embed = utils.make_message._neg(
+                    stderr.decode("utf-8", "replace")
+                    or f"git pull exited with code {process.returncode}")
         else:
-            embed = utils.make_message._pos(output.decode("utf-8"))
+            embed = utils.make_message._pos(stdout.decode("utf-8", "replace"))
         await ctx.send(embed=embed)
 
     async def _commands__list(self, parser_: parser.CustomParser,
                               ctx: commands.Context) -> None:
-        corecmds = [f"core[{i}] -> '{cmd.qualified_name}'@"
+        corecmds = (f"core[{i}] -> '{cmd.qualified_name}'@"
                     f"{cmd.callback.__name__}" for i, cmd in
-                    enumerate(self._controller.commands)]
-        appcmds = [f"app[{i}] -> '{cmd.qualified_name}'@{cmd.callback.__name__}"
+                    enumerate(self._controller.commands))
+        appcmds = (f"app[{i}] -> '{cmd.qualified_name}'@{cmd.callback.__name__}"
                    for i, cmd in
-                   enumerate(self._controller.tree.get_commands())]
-        embed = utils.make_message._def("\n".join(corecmds+appcmds))
+                   enumerate(self._controller.tree.get_commands()))
+        embed = utils.make_message._def("\n".join(itertools.chain(corecmds, appcmds)))
         await ctx.send(embed=embed)
 
     async def _trackers__list(self, parser_: parser.CustomParser,
                               ctx: commands.Context) -> None:
-        embed = utils.make_message._def(", ".join(list(
-                self._trackers._groups.keys())) or "NONE")
+        embed = utils.make_message._def(", ".join(self._trackers._groups) or "NONE")
         await ctx.send(embed=embed)
 
     async def _trackers__get(self, parser_: parser.CustomParser,
@@ -874,10 +958,11 @@ class DevTools:
         if __tracker not in self._trackers._groups:
             parser_.error(f"tracker '{__tracker}' does not exist")
         tracker = self._trackers[__tracker]
-        current_users = "\n    ".join(tracker._active)
-        user_history = "\n    ".join(list(reversed(tracker._history)))
-        counts = "\n".join([f"    {k} -> {v}" for k, v in
-                            tracker._counts.items()])
+        current_users = "\n    ".join(tracker._active.elements())
+        user_history = "\n    ".join(tracker._format_history_entry(u, ts)
+                                       for u, ts in reversed(tracker._history))
+        counts = "\n".join(f"    {k} -> {v}" for k, v in
+                            tracker._counts.items())
         embed = utils.make_message._def(f"CURRENT USERS\n    {current_users}\n\nUSER"
                                   f" HISTORY [15]\n    {user_history}\n\n"
                                   f"COUNTS\n{counts}")
@@ -889,13 +974,16 @@ class DevTools:
             parser_.error("the files path has not been defined, and thus all (files | f) "
                           "operations of this command are non-operable")
         
-        path = pathlib.Path(self._files_path, *dir_)
-        directories = None
-        files = None
-        for r, d, f in os.walk(path):
-            directories = d
-            files = f
-            break
+        path = os.path.join(self._files_path, *dir_)
+        directories: list[str] = []
+        files: list[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    (directories if entry.is_dir() else files).append(entry.name)
+        except OSError:
+            # missing path or not a directory; reported as empty below
+            pass
 
         lines: list[str] = []
         if directories:
@@ -916,16 +1004,8 @@ class DevTools:
                           "operations of this command are non-operable")
 
         path = pathlib.Path(self._files_path, *subpath)
-        buffer = io.BytesIO()
-        if path.is_dir():
-            with zipfile.ZipFile(buffer, "a") as zip_file:
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        zip_file.write(pathlib.Path(root, f))
-        else:
-            with zipfile.ZipFile(buffer, "a") as zip_file:
-                zip_file.write(path, path.name)
-        buffer.seek(0)
+        # zipping is blocking file I/O, so keep it off the event loop
+        buffer = await asyncio.to_thread(utils._zip_path, path)
         await ctx.send(file=discord.File(buffer, f"dpy_devtools_zipped_{int(time.time())}.zip"))
 
     async def _files__upload(self, parser_: parser.CustomParser, ctx: commands.Context,
@@ -935,8 +1015,8 @@ class DevTools:
                           "operations of this command are non-operable")
 
         # make path and ensure it is not a directory
-        path = pathlib.Path(self._files_path, *subpath)
-        if path.is_dir():
+        path = os.path.join(self._files_path, *subpath)
+        if os.path.isdir(path):
             parser_.error("the given path is a directory; (-u | --upload) may only be used on "
                           "files")
 
@@ -961,11 +1041,12 @@ class DevTools:
         # handle attachment saving
         if len(msg.attachments) != 1:
             parser_.error("exactly one attachment must be sent; this dialog has been cancelled")
-        await msg.attachments[0].save(path)
+        attachment = msg.attachments[0]
+        await attachment.save(path)
 
         # success embed
-        embed = utils.make_message._pos(f"The file '{msg.attachments[0].filename}' has "
-                                        f"successfully been saved to '{str(path)}'.")
+        embed = utils.make_message._pos(f"The file '{attachment.filename}' has "
+                                        f"successfully been saved to '{path}'.")
         await ctx.send(embed=embed)
 
     async def _files__remove(self, parser_: parser.CustomParser, ctx: commands.Context,
@@ -975,25 +1056,23 @@ class DevTools:
                           "operations of this command are non-operable")
 
         # make path and get remover (rmdir | unlink)
-        path = pathlib.Path(self._files_path, *subpath)
-        if not path.exists():
+        path = os.path.join(self._files_path, *subpath)
+        if not os.path.exists(path):
             parser_.error("the given path does not exist")
-        if path.is_dir():
-            try:
-                next(path.iterdir()) # raises StopIteration if there are no files in directory
-                embed = utils.make_message._neg("The given directory is not empty.")
-                await ctx.send(embed=embed)
-                return
-            except StopIteration:
-                ...
-            remover = path.rmdir
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                if next(entries, None) is not None:
+                    embed = utils.make_message._neg("The given directory is not empty.")
+                    await ctx.send(embed=embed)
+                    return
+            remover = functools.partial(os.rmdir, path)
         else:
-            remover = path.unlink
+            remover = functools.partial(os.unlink, path)
         
         # confirmation message
-        code = "".join(random.sample(string.ascii_letters + string.digits, 25))
+        code = secrets.token_urlsafe(19)[:25]
         embed = utils.make_message._raw(f"```\nSend the following code to confirm the removal of "
-                                        f"'{str(path)}':\n\n{code}```\n*This dialog will "
+                                        f"'{path}':\n\n{code}```\n*This dialog will "
                                         "automatically be cancelled "
                                         f"<t:{int(time.time() + 300)}:R>.*",
                                         constants.EMBED_COLOR__POS)
@@ -1013,5 +1092,5 @@ class DevTools:
         remover()
 
         # send success message
-        embed = utils.make_message._pos(f"'{str(path)}' has successfully been removed.")
+        embed = utils.make_message._pos(f"'{path}' has successfully been removed.")
         await ctx.send(embed=embed)
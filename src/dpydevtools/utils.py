@@ -10,28 +10,41 @@ __copyright__ = "Copyright (c) 2022-present Tanner B. Corcoran"
 
 from discord.ext import commands
 from . import constants
+import functools
+import tempfile
+import asyncio
 import pathlib
 import logging
 import pkgutil
+import zipfile
 import discord
 import typing
 import sys
 import os
 
-# ADAPTED FROM discord.py
-def stream_supports_color(stream: typing.Any) -> bool:
+@functools.lru_cache(maxsize=1)
+def _env_supports_color() -> bool | None:
+    # the environment part of `stream_supports_color`, read once; None means
+    # the answer depends on whether the stream is a tty
     # Pycharm and Vscode support colour in their inbuilt editors
     if ("PYCHARM_HOSTED" in os.environ or
         os.environ.get("TERM_PROGRAM") == "vscode"):
         return True
 
-    is_a_tty = hasattr(stream, 'isatty') and stream.isatty()
     if sys.platform != "win32":
-        return is_a_tty
+        return None
 
     # ANSICON checks for things like ConEmu
     # WT_SESSION checks if this is Windows Terminal
-    return is_a_tty and ("ANSICON" in os.environ or "WT_SESSION" in os.environ)
+    return None if ("ANSICON" in os.environ or "WT_SESSION" in os.environ) else False
+
+
+# ADAPTED FROM discord.py
+def stream_supports_color(stream: typing.Any) -> bool:
+    env = _env_supports_color()
+    if env is not None:
+        return env
+    return hasattr(stream, 'isatty') and stream.isatty()
 
 # ADAPTED FROM discord.py
 def setup_logging(logger: logging.Logger, level: int | str):
@@ -50,21 +63,77 @@ def setup_logging(logger: logging.Logger, level: int | str):
 
 
 def _ensure_chars_allowed(__str: str) -> None:
-    if not set(__str).issubset(constants.ALLOWCHARS):
+    if __str.translate(constants.ALLOWCHARS__DELETE):
         raise ValueError(f"\"{__str}\" must only include lowercase "
                          "alphanumericals and underscores")
 
 
-def _get_extensions(path: pathlib.Path, include_prefix: bool = True) -> list[str]:
+_extensions_cache: dict[tuple[str, bool], tuple[int, dict[str, None]]] = {}
+
+
+def _get_extensions(path: pathlib.Path,
+                    include_prefix: bool = True) -> dict[str, None]:
+    # an insertion-ordered dict keeps the listing order while making
+    # membership checks O(1); the directory's mtime changes whenever an entry
+    # is added, removed or renamed, so the cached result stays valid until then
+    # (adding `__init__.py` to an existing subdirectory does not touch it, so
+    # such a subpackage only shows up once the directory itself changes)
+    key = (str(path), include_prefix)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        # a missing directory simply has no extensions
+        return {}
+    cached = _extensions_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     if include_prefix:
-        return [m.name for m in pkgutil.iter_modules([str(path)], f"{'.'.join(path.parts)}.")]
-    return [m.name for m in pkgutil.iter_modules([str(path)])]
+        extensions = dict.fromkeys(m.name for m in pkgutil.iter_modules([str(path)], f"{'.'.join(path.parts)}."))
+    else:
+        extensions = dict.fromkeys(m.name for m in pkgutil.iter_modules([str(path)]))
+    _extensions_cache[key] = (mtime, extensions)
+    return extensions
+
+
+async def count_successes(tasks: typing.Iterable[tuple[str, typing.Awaitable]], *,
+                          logger: logging.Logger,
+                          concurrency: int = constants.FANOUT_CONCURRENCY) -> int:
+    # await every (label, awaitable) pair with at most `concurrency` in flight
+    # at once and count how many completed without raising; failures are
+    # logged to `logger` under their label
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(label: str, aw: typing.Awaitable) -> bool:
+        async with semaphore:
+            try:
+                await aw
+            except Exception:
+                logger.warning("%s failed", label, exc_info=True)
+                return False
+            return True
+
+    return sum(await asyncio.gather(*(run(label, aw) for label, aw in tasks)))
+
+
+def _zip_path(path: pathlib.Path) -> tempfile.SpooledTemporaryFile:
+    # small archives stay in memory, larger ones are spilled to disk
+    buffer = tempfile.SpooledTemporaryFile(max_size=constants.ZIP_SPOOL_MAX_SIZE)
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=1) as zip_file:
+        if path.is_dir():
+            for root, _, files in os.walk(path):
+                for f in files:
+                    zip_file.write(pathlib.Path(root, f))
+        else:
+            zip_file.write(path, path.name)
+    buffer.seek(0)
+    return buffer
 
 
 class make_message:
     @staticmethod
     def _make(body: str, color: int) -> discord.Embed:
-        embed = discord.Embed(color=color, description="```\n" + body + "```")
+        embed = discord.Embed(color=color, description=f"```\n{body}```")
         embed.set_footer(text=constants.CREATOR_REFERENCE)
         return embed
 
@@ -74,36 +143,31 @@ class make_message:
         embed.set_footer(text=constants.CREATOR_REFERENCE)
         return embed
 
-    @staticmethod
-    def _pos(body: str) -> discord.Embed:
-        return make_message._make(body, constants.EMBED_COLOR__POS)
-    
-    @staticmethod
-    def _neg(body: str) -> discord.Embed:
-        return make_message._make(body, constants.EMBED_COLOR__NEG)
-    
-    @staticmethod
-    def _def(body: str) -> discord.Embed:
-        return make_message._make(body, constants.EMBED_COLOR__DEF)
+    # colours are bound once at import time
+    _pos = staticmethod(functools.partial(_make, color=constants.EMBED_COLOR__POS))
+    _neg = staticmethod(functools.partial(_make, color=constants.EMBED_COLOR__NEG))
+    _def = staticmethod(functools.partial(_make, color=constants.EMBED_COLOR__DEF))
 
 
 def get_user_id(utx: commands.Context | discord.Interaction) -> int:
-    try:
-        id = utx.author.id
-        if id:
-            return id
-    except Exception:
+    author = getattr(utx, "author", None)
+    if author is None:
         return utx.user.id
+    return author.id
 
 
+@functools.singledispatch
 def get_sender(utx: commands.Context | discord.Interaction):
-    if isinstance(utx, commands.Context):
-        return utx.send
     if utx.response.is_done():
         return utx.followup.send
     return utx.response.send_message
 
 
+@get_sender.register
+def _(utx: commands.Context):
+    return utx.send
+
+
 def get_guild_id(utx: commands.Context | discord.Interaction) -> int:
     try:
         return utx.guild.id
@@ -133,11 +197,10 @@ class _ColourFormatter(logging.Formatter):
         )
         for level, colour in LEVEL_COLORS
     }
+    DEFAULT_FORMAT = FORMATS[logging.DEBUG]
 
     def format(self, record):
-        formatter = self.FORMATS.get(record.levelno)
-        if formatter is None:
-            formatter = self.FORMATS[logging.DEBUG]
+        formatter = self.FORMATS.get(record.levelno, self.DEFAULT_FORMAT)
 
         # Override the traceback to always print in red
         if record.exc_info: